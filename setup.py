@@ -41,6 +41,10 @@ setup(
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
+        "fast": [
+            "orjson>=3.6",
+            "ijson>=3.1",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
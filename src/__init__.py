@@ -12,9 +12,15 @@ __version__ = "1.0.0"
 __author__ = "Ronald Siebes"
 __email__ = "r.siebes@vu.nl"
 
-from .codemeta_generator import CodeMetaGenerator, create_soda_science_organization, create_publication_reference
-from .enhancer import CodeMetaEnhancer
-from .bulk_processor import BulkProcessor
+# Public names are imported on first access, so that importing the package
+# (e.g. to run the CLI) does not import requests and the processing modules
+_LAZY_IMPORTS = {
+    "CodeMetaGenerator": "codemeta_generator",
+    "create_soda_science_organization": "codemeta_generator",
+    "create_publication_reference": "codemeta_generator",
+    "CodeMetaEnhancer": "enhancer",
+    "BulkProcessor": "bulk_processor"
+}
 
 __all__ = [
     "CodeMetaGenerator",
@@ -24,3 +30,16 @@ __all__ = [
     "create_publication_reference"
 ]
 
+
+def __getattr__(name):
+    """Import public names lazily on first access."""
+    if name in _LAZY_IMPORTS:
+        import importlib
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List the lazily imported public names along with the module globals."""
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -9,15 +9,112 @@ Author: Ronald Siebes (UCDS Group, VU Amsterdam)
 ORCID: 0000-0001-8772-7904
 """
 
-import json
 import os
-import glob
-from typing import Dict, List, Optional, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+from typing import Any, Dict, Iterator, List, Optional, Callable, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import logging
+from datetime import datetime, timezone
 
 from .codemeta_generator import CodeMetaGenerator, create_soda_science_organization
 from .enhancer import CodeMetaEnhancer
+from . import json_io
+
+
+def _run_guarded(worker: Callable, args: Tuple, item: str) -> Tuple[Any, Optional[str]]:
+    """Run worker(item, *args), returning (result, None) or (None, error message)."""
+    try:
+        return worker(item, *args), None
+    except Exception as e:
+        return None, f"Error: {str(e)}"
+
+
+# Pipeline transforms take (codemeta, filepath) and return the transformed
+# CodeMeta dictionary, or None when the document was left unchanged
+Transform = Callable[[Dict, str], Optional[Dict]]
+
+
+def _enhance_transform(enhancer: CodeMetaEnhancer, organization_info: Optional[Dict],
+                       codemeta: Dict, filepath: str) -> Dict:
+    """Enhance a CodeMeta document and add organizational context if provided."""
+    enhanced = enhancer.enhance_codemeta(codemeta, in_place=True)
+    
+    if organization_info:
+        enhancer.add_organizational_context(enhanced, organization_info)
+    
+    return enhanced
+
+
+def _requirements_transform(requirements_lookup: Dict[str, Dict], codemeta: Dict,
+                            filepath: str) -> Optional[Dict]:
+    """Convert string software requirements into requirement objects."""
+    if "softwareRequirements" not in codemeta:
+        return None
+    
+    # Update software requirements
+    updated_requirements = []
+    changed = False
+    
+    for req in codemeta["softwareRequirements"]:
+        if isinstance(req, str):
+            changed = True
+            # Look up in mapping
+            package_name = req.rsplit('/', 1)[-1]
+            requirement = requirements_lookup.get(req)
+            if requirement is None:
+                requirement = requirements_lookup.get(package_name)
+            
+            if requirement is not None:
+                updated_requirements.append(requirement)
+            else:
+                # Create basic requirement object
+                updated_requirements.append({
+                    "@id": req,
+                    "@type": "SoftwareApplication",
+                    "identifier": package_name,
+                    "name": package_name
+                })
+        else:
+            updated_requirements.append(req)
+    
+    # Only report a change when a requirement was actually converted
+    if not changed:
+        return None
+    
+    codemeta["softwareRequirements"] = updated_requirements
+    return codemeta
+
+
+def _publication_transform(publications_mapping: Dict[str, Dict], codemeta: Dict,
+                           filepath: str) -> Optional[Dict]:
+    """Add the reference publication mapped to the file's project name."""
+    # Strip the 'codemeta_' prefix and '.json' suffix (_find_codemeta_files
+    # only returns .json files; str.removeprefix needs Python 3.9)
+    project_name = os.path.basename(filepath)[:-len('.json')]
+    if project_name.startswith('codemeta_'):
+        project_name = project_name[len('codemeta_'):]
+    
+    # Check if we have publications for this project
+    if project_name not in publications_mapping:
+        return None
+    
+    codemeta["referencePublication"] = publications_mapping[project_name]
+    return codemeta
+
+
+# Per-process BulkProcessor used when CPU-bound work runs on a process pool
+_worker_processor: Optional["BulkProcessor"] = None
+
+
+def _init_worker_process(schema_version: str, pretty: bool) -> None:
+    """Create the BulkProcessor that a worker process runs its tasks on."""
+    global _worker_processor
+    _worker_processor = BulkProcessor(schema_version, max_workers=1, pretty=pretty)
+
+
+def _run_in_worker_process(method_name: str, args: Tuple, item: str) -> Tuple[Any, Optional[str]]:
+    """Run a BulkProcessor method by name on the worker process' processor."""
+    return _run_guarded(getattr(_worker_processor, method_name), args, item)
 
 
 class BulkProcessor:
@@ -31,28 +128,124 @@ class BulkProcessor:
     - Batch validation and reporting
     """
     
-    def __init__(self, schema_version: str = "3.0", max_workers: int = 4):
+    def __init__(self, schema_version: str = "3.0", max_workers: int = 4,
+                 use_processes: bool = False, organization_by_reference: bool = False,
+                 pretty: bool = True, cache_file: Optional[str] = None):
         """
         Initialize the bulk processor.
         
         Args:
             schema_version: CodeMeta schema version to use
             max_workers: Maximum number of concurrent workers
+            use_processes: Run CPU-bound file enhancement and validation on a
+                process pool instead of the thread pool
+            organization_by_reference: Write the organizational context once
+                to organization.jsonld in the output directory and link it from
+                each file by its @id, instead of embedding it in every file
+            pretty: Write indented CodeMeta files; disable to write compact
+                JSON for files that are only processed further by tools
+            cache_file: Optional SQLite file for caching GitHub API responses
+                between runs
         """
         self.schema_version = schema_version
         self.max_workers = max_workers
-        self.generator = CodeMetaGenerator(schema_version)
+        self.use_processes = use_processes
+        self.organization_by_reference = organization_by_reference
+        self.pretty = pretty
+        
+        # Log progress every this many items instead of once per item
+        self._log_every = 50
+        # Every fetch thread gets its own keep-alive connection
+        self.generator = CodeMetaGenerator(schema_version, cache_file,
+                                           max_connections=max_workers)
         self.enhancer = CodeMetaEnhancer(schema_version)
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
     
+    def _iter_parallel(self, worker: Callable, items: Sequence[str], *args,
+                       cpu_bound: bool = False) -> Iterator[Tuple[str, Any, Optional[str]]]:
+        """
+        Run a per-item worker concurrently on the thread or process pool.
+        
+        Args:
+            worker: Callable invoked as worker(item, *args); for CPU-bound work
+                this must be a BulkProcessor method, so that worker processes
+                can run it on their own processor
+            items: Items (repository URLs or file paths) to process
+            *args: Additional positional arguments passed to the worker
+            cpu_bound: Use the process pool if use_processes is enabled
+            
+        Yields:
+            (item, result, error message) tuples in input order; the pool keeps
+            working on later items while earlier ones are consumed
+        """
+        # Never start more workers than there are items
+        max_workers = max(1, min(self.max_workers, len(items)))
+        
+        if cpu_bound and self.use_processes:
+            executor = ProcessPoolExecutor(max_workers=max_workers,
+                                           initializer=_init_worker_process,
+                                           initargs=(self.schema_version, self.pretty))
+            run_one = functools.partial(_run_in_worker_process, worker.__name__, args)
+            # Batch items to amortize inter-process communication
+            chunksize = max(1, len(items) // (max_workers * 4))
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            run_one = functools.partial(_run_guarded, worker, args)
+            chunksize = 1
+        
+        with executor:
+            results = executor.map(run_one, items, chunksize=chunksize)
+            for item, (result, error_msg) in zip(items, results):
+                yield item, result, error_msg
+    
+    def _run_parallel(self, worker: Callable, items: Sequence[str], *args,
+                      cpu_bound: bool = False) -> Dict[str, Any]:
+        """
+        Run a per-item worker concurrently and collect its results.
+        
+        Args:
+            worker: Callable invoked as worker(item, *args)
+            items: Items (repository URLs or file paths) to process
+            *args: Additional positional arguments passed to the worker
+            cpu_bound: Use the process pool if use_processes is enabled
+            
+        Returns:
+            Dictionary mapping items to worker results or error messages
+        """
+        results = {}
+        
+        processed = self._iter_parallel(worker, items, *args, cpu_bound=cpu_bound)
+        for done, (item, result, error_msg) in enumerate(processed, 1):
+            self._record_result(results, item, result, error_msg)
+            self._log_progress(done, len(items))
+        
+        return results
+    
+    def _record_result(self, results: Dict[str, Any], item: str, result: Any,
+                       error_msg: Optional[str]) -> None:
+        """Store a worker result, logging it if it is an error message."""
+        if error_msg is None:
+            results[item] = result
+        else:
+            results[item] = error_msg
+            self.logger.error(f"❌ Failed: {item} - {error_msg}")
+    
+    def _log_progress(self, done: int, total: int) -> None:
+        """Log batched progress; failures and warnings are logged per item."""
+        if done % self._log_every == 0 or done == total:
+            self.logger.info(f"✅ Processed {done}/{total}")
+    
     def process_repository_list(self, repo_urls: List[str], output_dir: str, 
                               organization_info: Optional[Dict] = None) -> Dict[str, str]:
         """
         Process a list of repository URLs to generate CodeMeta files.
         
+        GitHub fetches run on the thread pool, while fetched repositories are
+        turned into CodeMeta files and saved as soon as they arrive.
+        
         Args:
             repo_urls: List of GitHub repository URLs
             output_dir: Directory to save generated CodeMeta files
@@ -64,48 +257,171 @@ class BulkProcessor:
         os.makedirs(output_dir, exist_ok=True)
         results = {}
         
-        self.logger.info(f"Processing {len(repo_urls)} repositories...")
+        if organization_info:
+            organization_info = self._organization_context(organization_info, output_dir)
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_url = {
-                executor.submit(self._process_single_repository, url, output_dir, organization_info): url
-                for url in repo_urls
-            }
-            
-            # Collect results
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    result = future.result()
-                    results[url] = result
-                    self.logger.info(f"✅ Processed: {url}")
-                except Exception as e:
-                    error_msg = f"Error: {str(e)}"
-                    results[url] = error_msg
-                    self.logger.error(f"❌ Failed: {url} - {error_msg}")
+        self.logger.info(f"Processing {len(repo_urls)} repositories...")
         
+        fetched = self._iter_repository_data(repo_urls)
+        for done, (repo_url, repo_data, error_msg) in enumerate(fetched, 1):
+            output_file = None
+            if error_msg is None:
+                output_file, error_msg = _run_guarded(self._save_single_repository,
+                                                      (repo_data, output_dir, organization_info),
+                                                      repo_url)
+            self._record_result(results, repo_url, output_file, error_msg)
+            self._log_progress(done, len(repo_urls))
+    
         return results
     
-    def _process_single_repository(self, repo_url: str, output_dir: str, 
-                                 organization_info: Optional[Dict]) -> str:
-        """Process a single repository and return the output file path."""
+    def _iter_repository_data(self, repo_urls: List[str]) -> Iterator[Tuple[str, Any, Optional[str]]]:
+        """
+        Fetch repository data, yielding (URL, data, error message) in input order.
+        
+        With a GitHub token, repositories are first fetched in GraphQL batches;
+        the remaining ones are fetched one by one on the thread pool.
+        """
+        prefetched = {}
+        if self.generator.github_token:
+            prefetched = self.generator.fetch_many_repository_data(repo_urls)
+        
+        remaining = [repo_url for repo_url in repo_urls if repo_url not in prefetched]
+        fetched = self._iter_parallel(self.generator.fetch_repository_data, remaining)
+        
+        for repo_url in repo_urls:
+            if repo_url in prefetched:
+                yield repo_url, prefetched[repo_url], None
+            else:
+                yield next(fetched)
+        
+        fetched.close()
+    
+    def _save_single_repository(self, repo_url: str, repo_data: Dict, output_dir: str,
+                                organization_info: Optional[Dict]) -> str:
+        """Build CodeMeta from fetched repository data and return the output file path."""
         # Extract repository name for filename
-        repo_name = repo_url.split('/')[-1]
+        repo_name = repo_url.rstrip('/').rsplit('/', 1)[-1]
         output_file = os.path.join(output_dir, f"codemeta_{repo_name}.json")
         
         # Generate CodeMeta
-        codemeta = self.generator.generate_from_github(repo_url)
+        codemeta = self.generator.generate_from_repo_data(repo_data, repo_url)
         
         # Add organizational context if provided
         if organization_info:
             self.generator.add_organizational_context(codemeta, organization_info)
         
         # Save the file
-        self.generator.save_codemeta(codemeta, output_file)
+        json_io.dump_json(codemeta, output_file, self.pretty)
         
         return output_file
     
+    def apply_pipeline(self, directory: str, transforms: List[Transform],
+                       output_dir: Optional[str] = None) -> Dict[str, str]:
+        """
+        Apply a chain of transforms to all CodeMeta files in a directory.
+        
+        Each file is parsed once, passed through every transform in order and
+        written at most once, so combining several bulk operations does not
+        re-read and re-serialize every file for each of them. The transforms
+        returned by enhancement_transform, requirements_transform and
+        publication_transform can be combined freely; custom transforms must be
+        picklable when use_processes is enabled.
+        
+        Args:
+            directory: Directory containing CodeMeta files
+            transforms: Callables invoked as transform(codemeta, filepath) that
+                return the transformed CodeMeta dictionary, or None if they left
+                the document unchanged
+            output_dir: Output directory (updates files in place if None)
+            
+        Returns:
+            Dictionary mapping input files to output files or status/error messages
+        """
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        codemeta_files = self._find_codemeta_files(directory)
+        
+        self.logger.info(f"Applying {len(transforms)} transforms to {len(codemeta_files)} CodeMeta files...")
+        
+        return self._apply_pipeline(codemeta_files, transforms, output_dir)
+    
+    def _apply_pipeline(self, codemeta_files: Sequence[str], transforms: List[Transform],
+                        output_dir: Optional[str], written_status: Optional[str] = None,
+                        unchanged_status: str = "No changes needed") -> Dict[str, str]:
+        """Run a transform pipeline over the given files on the worker pool."""
+        return self._run_parallel(self._apply_pipeline_single_file, codemeta_files,
+                                  transforms, output_dir, written_status, unchanged_status,
+                                  cpu_bound=True)
+    
+    def _apply_pipeline_single_file(self, filepath: str, transforms: List[Transform],
+                                    output_dir: Optional[str], written_status: Optional[str],
+                                    unchanged_status: str) -> str:
+        """Transform a single CodeMeta file, writing it once if needed."""
+        codemeta = json_io.load_json(filepath)
+        changed = False
+        
+        for transform in transforms:
+            transformed = transform(codemeta, filepath)
+            if transformed is not None:
+                codemeta = transformed
+                changed = True
+        
+        filename = os.path.basename(filepath)
+        output_file = os.path.join(output_dir, filename) if output_dir else filepath
+        
+        # Unchanged documents only need writing when they go somewhere else
+        if not changed and output_file == filepath:
+            return unchanged_status
+        
+        json_io.dump_json(codemeta, output_file, self.pretty)
+        
+        return written_status or output_file
+    
+    def enhancement_transform(self, organization_info: Optional[Dict] = None) -> Transform:
+        """
+        Create a pipeline transform that enhances CodeMeta files.
+        
+        Args:
+            organization_info: Optional organizational context to add
+            
+        Returns:
+            Transform for apply_pipeline
+        """
+        return functools.partial(_enhance_transform, self.enhancer, organization_info)
+    
+    def requirements_transform(self, requirements_mapping: Dict[str, Dict]) -> Transform:
+        """
+        Create a pipeline transform that converts string software requirements.
+        
+        Requirements are matched by their full string first and then by their
+        last path segment; mapping keys may be package names or URLs.
+        
+        Args:
+            requirements_mapping: Mapping of package names to requirement objects
+            
+        Returns:
+            Transform for apply_pipeline
+        """
+        # Build the lookup once for all files: URL-style keys are also
+        # reachable by their package name, exact keys take precedence
+        requirements_lookup = {key.rsplit('/', 1)[-1]: value for key, value in requirements_mapping.items()}
+        requirements_lookup.update(requirements_mapping)
+        
+        return functools.partial(_requirements_transform, requirements_lookup)
+    
+    def publication_transform(self, publications_mapping: Dict[str, Dict]) -> Transform:
+        """
+        Create a pipeline transform that adds reference publications.
+        
+        Args:
+            publications_mapping: Mapping of project names to publication objects
+            
+        Returns:
+            Transform for apply_pipeline
+        """
+        return functools.partial(_publication_transform, publications_mapping)
+    
     def enhance_directory(self, input_dir: str, output_dir: Optional[str] = None,
                          organization_info: Optional[Dict] = None) -> Dict[str, str]:
         """
@@ -121,60 +437,61 @@ class BulkProcessor:
         """
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
-        else:
-            output_dir = input_dir
         
         # Find CodeMeta files
         codemeta_files = self._find_codemeta_files(input_dir)
-        results = {}
         
-        self.logger.info(f"Enhancing {len(codemeta_files)} CodeMeta files...")
+        if organization_info:
+            organization_info = self._organization_context(organization_info, output_dir or input_dir)
         
-        for input_file in codemeta_files:
-            try:
-                filename = os.path.basename(input_file)
-                output_file = os.path.join(output_dir, filename)
-                
-                # Enhance the file
-                enhanced = self.enhancer.enhance_file(input_file, output_file)
-                
-                # Add organizational context if provided
-                if organization_info:
-                    self.enhancer.add_organizational_context(enhanced, organization_info)
-                    
-                    # Save again with organizational context
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump(enhanced, f, indent=2, ensure_ascii=False)
-                
-                results[input_file] = output_file
-                self.logger.info(f"✅ Enhanced: {filename}")
-                
-            except Exception as e:
-                error_msg = f"Error: {str(e)}"
-                results[input_file] = error_msg
-                self.logger.error(f"❌ Failed: {input_file} - {error_msg}")
+        self.logger.info(f"Enhancing {len(codemeta_files)} CodeMeta files...")
         
-        return results
+        return self._apply_pipeline(codemeta_files, [self.enhancement_transform(organization_info)],
+                                    output_dir)
     
-    def _find_codemeta_files(self, directory: str) -> List[str]:
-        """Find all CodeMeta files in a directory."""
-        patterns = [
-            os.path.join(directory, "codemeta*.json"),
-            os.path.join(directory, "codemeta.json"),
-            os.path.join(directory, "*codemeta*.json")
-        ]
+    def _organization_context(self, organization_info: Dict, output_dir: str) -> Dict:
+        """
+        Return the organizational context to add to each file.
         
-        files = []
-        for pattern in patterns:
-            files.extend(glob.glob(pattern))
+        With organization_by_reference enabled, the organization is written
+        once to organization.jsonld in the output directory and only a
+        reference to its @id is added to the individual files.
+        """
+        if not self.organization_by_reference:
+            return organization_info
+        
+        if "@id" not in organization_info:
+            raise ValueError("Organization must have an @id to be added by reference")
         
-        # Remove duplicates and return
-        return list(set(files))
+        organization_file = os.path.join(output_dir, "organization.jsonld")
+        json_io.dump_json({"@context": self.generator.context_url, **organization_info},
+                          organization_file)
+        
+        self.logger.info(f"Organization saved to: {organization_file}")
+        return {
+            "@type": organization_info.get("@type", "Organization"),
+            "@id": organization_info["@id"]
+        }
+    
+    def _find_codemeta_files(self, directory: str) -> Tuple[str, ...]:
+        """Find all CodeMeta files in a directory."""
+        # A single scandir pass; it provides the file type without a separate
+        # stat call on most platforms. The listing is not cached, as directory
+        # timestamps are too coarse on some filesystems to notice new files
+        with os.scandir(directory) as entries:
+            return tuple(
+                entry.path for entry in entries
+                if 'codemeta' in entry.name and entry.name.endswith('.json')
+                and not entry.name.startswith('.') and entry.is_file()
+            )
     
     def update_software_requirements(self, directory: str, requirements_mapping: Dict[str, Dict]) -> Dict[str, str]:
         """
         Update software requirements across multiple CodeMeta files.
         
+        Requirements are matched by their full string first and then by their
+        last path segment; mapping keys may be package names or URLs.
+        
         Args:
             directory: Directory containing CodeMeta files
             requirements_mapping: Mapping of package names to requirement objects
@@ -183,52 +500,11 @@ class BulkProcessor:
             Dictionary mapping files to update status
         """
         codemeta_files = self._find_codemeta_files(directory)
-        results = {}
         
         self.logger.info(f"Updating software requirements in {len(codemeta_files)} files...")
         
-        for filepath in codemeta_files:
-            try:
-                # Load file
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    codemeta = json.load(f)
-                
-                # Update software requirements
-                if "softwareRequirements" in codemeta:
-                    updated_requirements = []
-                    
-                    for req in codemeta["softwareRequirements"]:
-                        if isinstance(req, str):
-                            # Look up in mapping
-                            package_name = req.split('/')[-1] if '/' in req else req
-                            if package_name in requirements_mapping:
-                                updated_requirements.append(requirements_mapping[package_name])
-                            else:
-                                # Create basic requirement object
-                                updated_requirements.append({
-                                    "@id": req,
-                                    "@type": "SoftwareApplication",
-                                    "identifier": package_name,
-                                    "name": package_name
-                                })
-                        else:
-                            updated_requirements.append(req)
-                    
-                    codemeta["softwareRequirements"] = updated_requirements
-                
-                # Save updated file
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(codemeta, f, indent=2, ensure_ascii=False)
-                
-                results[filepath] = "Updated successfully"
-                self.logger.info(f"✅ Updated: {os.path.basename(filepath)}")
-                
-            except Exception as e:
-                error_msg = f"Error: {str(e)}"
-                results[filepath] = error_msg
-                self.logger.error(f"❌ Failed: {filepath} - {error_msg}")
-        
-        return results
+        return self._apply_pipeline(codemeta_files, [self.requirements_transform(requirements_mapping)],
+                                    None, written_status="Updated successfully")
     
     def add_reference_publications(self, directory: str, publications_mapping: Dict[str, Dict]) -> Dict[str, str]:
         """
@@ -242,44 +518,20 @@ class BulkProcessor:
             Dictionary mapping files to update status
         """
         codemeta_files = self._find_codemeta_files(directory)
-        results = {}
         
         self.logger.info(f"Adding reference publications to {len(codemeta_files)} files...")
         
-        for filepath in codemeta_files:
-            try:
-                # Load file
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    codemeta = json.load(f)
-                
-                # Extract project name from filename or CodeMeta name
-                filename = os.path.basename(filepath)
-                project_name = filename.replace('codemeta_', '').replace('.json', '')
-                
-                # Check if we have publications for this project
-                if project_name in publications_mapping:
-                    codemeta["referencePublication"] = publications_mapping[project_name]
-                    
-                    # Save updated file
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        json.dump(codemeta, f, indent=2, ensure_ascii=False)
-                    
-                    results[filepath] = "Publication added"
-                    self.logger.info(f"✅ Added publication: {project_name}")
-                else:
-                    results[filepath] = "No publication mapping found"
-                
-            except Exception as e:
-                error_msg = f"Error: {str(e)}"
-                results[filepath] = error_msg
-                self.logger.error(f"❌ Failed: {filepath} - {error_msg}")
-        
-        return results
+        return self._apply_pipeline(codemeta_files, [self.publication_transform(publications_mapping)],
+                                    None, written_status="Publication added",
+                                    unchanged_status="No publication mapping found")
     
     def validate_directory(self, directory: str) -> Dict[str, List[str]]:
         """
         Validate all CodeMeta files in a directory.
         
+        Very large files are streamed and only their top-level outline is
+        validated, see json_io.load_json_outline.
+        
         Args:
             directory: Directory containing CodeMeta files
             
@@ -287,34 +539,30 @@ class BulkProcessor:
             Dictionary mapping files to validation messages
         """
         codemeta_files = self._find_codemeta_files(directory)
-        results = {}
         
         self.logger.info(f"Validating {len(codemeta_files)} CodeMeta files...")
         
-        for filepath in codemeta_files:
-            try:
-                # Load file
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    codemeta = json.load(f)
-                
-                # Validate using both generator and enhancer
-                generator_warnings = self.generator.validate_codemeta(codemeta)
-                enhancer_messages = self.enhancer.validate_enhancement(codemeta)
-                
-                all_messages = generator_warnings + enhancer_messages
-                results[filepath] = all_messages
-                
-                if not generator_warnings:
-                    self.logger.info(f"✅ Valid: {os.path.basename(filepath)}")
-                else:
-                    self.logger.warning(f"⚠️  Issues: {os.path.basename(filepath)}")
-                
-            except Exception as e:
-                error_msg = f"Validation error: {str(e)}"
-                results[filepath] = [error_msg]
-                self.logger.error(f"❌ Failed: {filepath} - {error_msg}")
+        return self._run_parallel(self._validate_single_file, codemeta_files, cpu_bound=True)
+    
+    def _validate_single_file(self, filepath: str) -> List[str]:
+        """Validate a single CodeMeta file and return its validation messages."""
+        try:
+            # Load file; validation only looks at the top-level fields
+            codemeta = json_io.load_json_outline(filepath)
+            
+            # Validate using both generator and enhancer
+            generator_warnings = self.generator.validate_codemeta(codemeta)
+            enhancer_messages = self.enhancer.validate_enhancement(codemeta)
+            
+        except Exception as e:
+            error_msg = f"Validation error: {str(e)}"
+            self.logger.error(f"❌ Failed: {filepath} - {error_msg}")
+            return [error_msg]
+        
+        if generator_warnings:
+            self.logger.warning(f"⚠️  Issues: {os.path.basename(filepath)}")
         
-        return results
+        return generator_warnings + enhancer_messages
     
     def generate_report(self, results: Dict[str, str], output_file: str) -> None:
         """
@@ -324,16 +572,17 @@ class BulkProcessor:
             results: Results dictionary from processing operations
             output_file: Path to save the report
         """
+        failed = sum(1 for r in results.values() if r.startswith("Error"))
+        
         report = {
-            "timestamp": str(datetime.now()),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "total_files": len(results),
-            "successful": len([r for r in results.values() if not r.startswith("Error")]),
-            "failed": len([r for r in results.values() if r.startswith("Error")]),
+            "successful": len(results) - failed,
+            "failed": failed,
             "details": results
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        json_io.dump_json(report, output_file)
         
         self.logger.info(f"Report saved to: {output_file}")
 
@@ -9,19 +9,22 @@ ORCID: 0000-0001-8772-7904
 """
 
 import argparse
-import json
 import os
 import sys
 from typing import List, Dict
 
-from .codemeta_generator import CodeMetaGenerator, create_soda_science_organization
-from .enhancer import CodeMetaEnhancer
-from .bulk_processor import BulkProcessor
+from . import json_io
+
+# The generator, enhancer and bulk processor are imported by the commands
+# that use them, so that parsing arguments and --help do not pay for
+# importing requests and the other processing dependencies
 
 
 def generate_command(args):
     """Handle the generate command."""
-    generator = CodeMetaGenerator(args.schema)
+    from .codemeta_generator import CodeMetaGenerator, create_soda_science_organization
+    
+    generator = CodeMetaGenerator(args.schema, args.cache_file)
     
     try:
         print(f"Generating CodeMeta for: {args.repo}")
@@ -51,6 +54,9 @@ def generate_command(args):
 
 def enhance_command(args):
     """Handle the enhance command."""
+    from .codemeta_generator import create_soda_science_organization
+    from .enhancer import CodeMetaEnhancer
+    
     enhancer = CodeMetaEnhancer(args.schema)
     
     try:
@@ -64,8 +70,7 @@ def enhance_command(args):
             
             # Save again with organizational context
             output_file = args.output or args.input
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(enhanced, f, indent=2, ensure_ascii=False)
+            json_io.dump_json(enhanced, output_file)
         
         # Validate enhancement
         messages = enhancer.validate_enhancement(enhanced)
@@ -82,7 +87,12 @@ def enhance_command(args):
 
 def bulk_command(args):
     """Handle the bulk command."""
-    processor = BulkProcessor(args.schema, args.workers)
+    from .codemeta_generator import create_soda_science_organization
+    from .bulk_processor import BulkProcessor
+    
+    processor = BulkProcessor(args.schema, args.workers, use_processes=args.processes,
+                              organization_by_reference=args.org_reference,
+                              pretty=not args.compact, cache_file=args.cache_file)
     
     try:
         if args.repos_file:
@@ -141,19 +151,18 @@ def bulk_command(args):
 
 def validate_command(args):
     """Handle the validate command."""
-    processor = BulkProcessor(args.schema)
+    from .bulk_processor import BulkProcessor
+    
+    processor = BulkProcessor(args.schema, args.workers, use_processes=args.processes)
     
     try:
         if os.path.isfile(args.path):
-            # Validate single file
-            generator = CodeMetaGenerator(args.schema)
-            enhancer = CodeMetaEnhancer(args.schema)
-            
-            with open(args.path, 'r', encoding='utf-8') as f:
-                codemeta = json.load(f)
+            # Validate single file, reusing the processor's validators;
+            # large files are streamed, as validation only needs their outline
+            codemeta = json_io.load_json_outline(args.path)
             
-            warnings = generator.validate_codemeta(codemeta)
-            messages = enhancer.validate_enhancement(codemeta)
+            warnings = processor.generator.validate_codemeta(codemeta)
+            messages = processor.enhancer.validate_enhancement(codemeta)
             
             print(f"Validating: {args.path}")
             all_messages = warnings + messages
@@ -231,6 +240,8 @@ Examples:
     generate_parser.add_argument('--output', required=True, help='Output CodeMeta file path')
     generate_parser.add_argument('--organization', choices=['soda'], 
                                 help='Add organizational context')
+    generate_parser.add_argument('--cache-file',
+                                help='SQLite file for caching GitHub API responses between runs')
     
     # Enhance command
     enhance_parser = subparsers.add_parser('enhance', help='Enhance existing CodeMeta file')
@@ -249,6 +260,14 @@ Examples:
                             help='Add organizational context')
     bulk_parser.add_argument('--workers', type=int, default=4, 
                             help='Number of concurrent workers (default: 4)')
+    bulk_parser.add_argument('--processes', action='store_true',
+                            help='Use worker processes instead of threads for enhancing files')
+    bulk_parser.add_argument('--org-reference', action='store_true',
+                            help='Write the organization once to organization.jsonld and reference it by @id')
+    bulk_parser.add_argument('--compact', action='store_true',
+                            help='Write compact JSON instead of indented files')
+    bulk_parser.add_argument('--cache-file',
+                            help='SQLite file for caching GitHub API responses between runs')
     bulk_parser.add_argument('--report', help='Generate processing report file')
     
     # Validate command
@@ -256,6 +275,10 @@ Examples:
     validate_parser.add_argument('path', help='File or directory to validate')
     validate_parser.add_argument('--verbose', action='store_true', 
                                 help='Show detailed validation results')
+    validate_parser.add_argument('--workers', type=int, default=4,
+                                help='Number of concurrent workers for directories (default: 4)')
+    validate_parser.add_argument('--processes', action='store_true',
+                                help='Use worker processes instead of threads for validating files')
     
     args = parser.parse_args()
     
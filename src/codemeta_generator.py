@@ -9,13 +9,53 @@ Author: Ronald Siebes (UCDS Group, VU Amsterdam)
 ORCID: 0000-0001-8772-7904
 """
 
-import json
+import logging
+import os
 import requests
 import re
-from datetime import datetime
-from typing import Dict, List, Optional, Union
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from . import json_io
+    from .github_cache import GitHubCache
+    from .platforms import DEFAULT_PLATFORM, runtime_platforms
+except ImportError:
+    # Run as a script, or imported with src on sys.path
+    import json_io
+    from github_cache import GitHubCache
+    from platforms import DEFAULT_PLATFORM, runtime_platforms
+
+logger = logging.getLogger(__name__)
+
+
+# Owner and repository name of a GitHub URL, without a trailing .git
+_GITHUB_URL_RE = re.compile(r'https://github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/|$)', re.IGNORECASE)
+
+# Fields checked by validate_codemeta, in the order they are reported
+_REQUIRED_FIELDS = ("@context", "@type", "name", "description", "url")
+_RECOMMENDED_FIELDS = ("author", "license", "programmingLanguage", "dateCreated")
+
+# Seconds to wait for the GitHub API before giving up on a request
+_GITHUB_TIMEOUT = 10
+
+# Longest wait, in seconds, for an exhausted rate limit to reset; if the
+# reset is further away, fetches fall back to basic repository information
+_RATE_LIMIT_MAX_WAIT = 15 * 60
+
+# GraphQL API used to fetch many repositories per request
+_GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+_GRAPHQL_BATCH_SIZE = 100
+_GRAPHQL_REPOSITORY_FIELDS = (
+    "name nameWithOwner description createdAt updatedAt url "
+    "primaryLanguage { name } licenseInfo { spdxId name }"
+)
+
 
 class CodeMetaGenerator:
     """
@@ -25,16 +65,50 @@ class CodeMetaGenerator:
     extraction from GitHub repositories.
     """
     
-    def __init__(self, schema_version: str = "3.0"):
+    __slots__ = ('schema_version', 'context_url', 'github_token', '_session', '_cache',
+                 '_fetched', '_fetched_lock', '_rate_limit_reset')
+    
+    def __init__(self, schema_version: str = "3.0", cache_file: Optional[str] = None,
+                 max_connections: int = 32, github_token: Optional[str] = None):
         """
         Initialize the CodeMeta generator.
         
         Args:
             schema_version: CodeMeta schema version ("2.0" or "3.0")
+            cache_file: Optional SQLite file for caching GitHub API responses
+                between runs
+            max_connections: Number of GitHub connections kept open, which
+                should be at least the number of threads fetching concurrently
+            github_token: GitHub token for higher rate limits and the GraphQL
+                API (defaults to the GITHUB_TOKEN environment variable)
         """
         self.schema_version = schema_version
         self.context_url = f"https://doi.org/10.5063/schema/codemeta-{schema_version}"
         
+        # One session for all requests, so connections are kept alive
+        self._session = requests.Session()
+        self._session.headers.update({
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'codemeta-generator'
+        })
+        retry = Retry(total=5, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        self._session.mount('https://', HTTPAdapter(pool_maxsize=max_connections,
+                                                    max_retries=retry))
+        self._cache = GitHubCache(cache_file) if cache_file else None
+        
+        # Repository data fetched by this generator, keyed by lowercased
+        # (owner, repo) since GitHub names are case-insensitive
+        self._fetched: Dict[Tuple[str, str], Dict] = {}
+        self._fetched_lock = threading.Lock()
+        
+        # Time at which an exhausted rate limit resets, or 0 while requests
+        # are still available
+        self._rate_limit_reset = 0.0
+        
+        self.github_token = github_token or os.environ.get('GITHUB_TOKEN')
+        if self.github_token:
+            self._session.headers['Authorization'] = f"Bearer {self.github_token}"
+        
     def generate_from_github(self, repo_url: str, **kwargs) -> Dict:
         """
         Generate a CodeMeta file from a GitHub repository.
@@ -46,19 +120,137 @@ class CodeMetaGenerator:
         Returns:
             Dictionary containing CodeMeta metadata
         """
+        repo_data = self.fetch_repository_data(repo_url)
+        return self.generate_from_repo_data(repo_data, repo_url, **kwargs)
+    
+    def fetch_repository_data(self, repo_url: str) -> Dict:
+        """
+        Fetch the raw repository data for a GitHub repository.
+        
+        This is the network-bound half of generate_from_github.
+        
+        Args:
+            repo_url: GitHub repository URL
+            
+        Returns:
+            Repository data as returned by the GitHub API
+        """
         # Parse repository information
         repo_info = self._parse_github_url(repo_url)
         if not repo_info:
             raise ValueError(f"Invalid GitHub URL: {repo_url}")
             
         # Fetch repository data from GitHub API
-        repo_data = self._fetch_github_data(repo_info['owner'], repo_info['repo'])
+        return self._fetch_github_data(repo_info['owner'], repo_info['repo'])
+        
+    def fetch_many_repository_data(self, repo_urls: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch the raw repository data for many GitHub repositories at once.
+        
+        Uses fetch_many_github, see there; invalid URLs and repositories that
+        could not be fetched are left out.
+        
+        Args:
+            repo_urls: GitHub repository URLs
+            
+        Returns:
+            Dictionary mapping repository URLs to REST-shaped repository data
+        """
+        repos = {}
+        for repo_url in repo_urls:
+            repo_info = self._parse_github_url(repo_url)
+            if repo_info:
+                repos[repo_url] = (repo_info['owner'], repo_info['repo'])
+        
+        fetched = self.fetch_many_github(list(dict.fromkeys(repos.values())))
+        
+        return {repo_url: fetched[repo] for repo_url, repo in repos.items() if repo in fetched}
+    
+    def fetch_many_github(self, repos: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict]:
+        """
+        Fetch repository data for many repositories with the GitHub GraphQL API.
+        
+        Repositories are queried in batches of 100 per request, which costs one
+        rate limit point per batch instead of one request per repository. The
+        GraphQL API requires a token; without one nothing is fetched.
+        
+        Args:
+            repos: (owner, repository name) tuples
+            
+        Returns:
+            Dictionary mapping (owner, repo) tuples to repository data shaped
+            like the REST API response; repositories that were not found or
+            whose batch failed are left out
+        """
+        results = {}
+        if not self.github_token:
+            return results
+        
+        for start in range(0, len(repos), _GRAPHQL_BATCH_SIZE):
+            batch = repos[start:start + _GRAPHQL_BATCH_SIZE]
+            
+            # One aliased repository field per repository, with the names
+            # passed as variables so they need no escaping
+            variables = {}
+            parameters = []
+            fields = []
+            for i, (owner, repo) in enumerate(batch):
+                variables[f"owner{i}"] = owner
+                variables[f"name{i}"] = repo
+                parameters.append(f"$owner{i}: String!, $name{i}: String!")
+                fields.append(f"r{i}: repository(owner: $owner{i}, name: $name{i}) "
+                              f"{{ {_GRAPHQL_REPOSITORY_FIELDS} }}")
+            query = f"query({', '.join(parameters)}) {{ {' '.join(fields)} }}"
+            
+            try:
+                response = self._session.post(_GITHUB_GRAPHQL_URL,
+                                              json={'query': query, 'variables': variables},
+                                              timeout=_GITHUB_TIMEOUT)
+                response.raise_for_status()
+                data = response.json().get('data') or {}
+            except (requests.RequestException, ValueError):
+                continue
+            
+            for i, repo in enumerate(batch):
+                node = data.get(f"r{i}")
+                if node:
+                    results[repo] = self._remember_fetched(*repo, self._graphql_to_rest(node))
         
-        # Generate base CodeMeta structure
-        codemeta = self._create_base_structure(repo_data, repo_url)
+        return results
+    
+    def _graphql_to_rest(self, node: Dict) -> Dict:
+        """Convert a GraphQL repository node to the REST API repository shape."""
+        language = node.get('primaryLanguage')
+        license_info = node.get('licenseInfo')
         
-        # Add comprehensive metadata
-        self._add_comprehensive_metadata(codemeta, repo_data)
+        return {
+            'name': node.get('name'),
+            'full_name': node.get('nameWithOwner'),
+            'html_url': node.get('url'),
+            'description': node.get('description'),
+            'created_at': node.get('createdAt'),
+            'updated_at': node.get('updatedAt'),
+            'language': language['name'] if language else None,
+            'license': {
+                'spdx_id': license_info.get('spdxId'),
+                'name': license_info.get('name')
+            } if license_info else None
+        }
+        
+    def generate_from_repo_data(self, repo_data: Dict, repo_url: str, **kwargs) -> Dict:
+        """
+        Generate a CodeMeta file from already fetched repository data.
+        
+        Args:
+            repo_data: Repository data as returned by fetch_repository_data
+            repo_url: GitHub repository URL
+            **kwargs: Additional metadata to include
+            
+        Returns:
+            Dictionary containing CodeMeta metadata
+        """
+        # Generate CodeMeta structure with comprehensive metadata
+        codemeta = self._build_codemeta(repo_data, repo_url)
         
         # Apply any additional metadata from kwargs
         codemeta.update(kwargs)
@@ -67,12 +259,11 @@ class CodeMetaGenerator:
     
     def _parse_github_url(self, url: str) -> Optional[Dict[str, str]]:
         """Parse GitHub URL to extract owner and repository name."""
-        pattern = r'https://github\.com/([^/]+)/([^/]+)/?'
-        match = re.match(pattern, url)
+        match = _GITHUB_URL_RE.match(url)
         if match:
             return {
-                'owner': match.group(1),
-                'repo': match.group(2)
+                'owner': match[1],
+                'repo': match[2]
             }
         return None
     
@@ -80,16 +271,37 @@ class CodeMetaGenerator:
         """
         Fetch repository data from GitHub API.
         
+        Responses are cached by ETag if a cache file is configured; cached
+        repositories are revalidated with a conditional request, which does
+        not count against the rate limit when nothing changed. Once the rate
+        limit is exhausted, the next fetch waits for it to reset. Repositories this
+        generator already fetched are not requested again.
+        
         Note: This is a simplified version. In production, you would want to:
-        - Add authentication for higher rate limits
         - Handle API errors gracefully
-        - Cache responses
         """
+        with self._fetched_lock:
+            fetched = self._fetched.get((owner.lower(), repo.lower()))
+        if fetched is not None:
+            return dict(fetched)
+        
         try:
             url = f"https://api.github.com/repos/{owner}/{repo}"
-            response = requests.get(url)
+            cache_key = f"{owner}/{repo}"
+            cached = self._cache.get(cache_key) if self._cache else None
+            
+            headers = {'If-None-Match': cached[0]} if cached else None
+            response = self._get_with_rate_limit(url, headers)
+            if cached and response.status_code == 304:
+                return self._remember_fetched(owner, repo, json_io.loads(cached[1]))
+            
             response.raise_for_status()
-            return response.json()
+            
+            etag = response.headers.get('ETag')
+            if self._cache and etag:
+                self._cache.set(cache_key, etag, response.content)
+            
+            return self._remember_fetched(owner, repo, response.json())
         except requests.RequestException as e:
             # Fallback to basic information if API fails
             return {
@@ -97,50 +309,96 @@ class CodeMetaGenerator:
                 'full_name': f"{owner}/{repo}",
                 'html_url': f"https://github.com/{owner}/{repo}",
                 'description': f"Repository: {repo}",
-                'created_at': datetime.now().isoformat(),
-                'updated_at': datetime.now().isoformat(),
+                # Unknown, rather than pretending the repository is new
+                'created_at': None,
+                'updated_at': None,
                 'language': 'Unknown',
                 'license': None
             }
     
-    def _create_base_structure(self, repo_data: Dict, repo_url: str) -> Dict:
-        """Create the base CodeMeta structure."""
+    def _remember_fetched(self, owner: str, repo: str, repo_data: Dict) -> Dict:
+        """Remember successfully fetched repository data and return a copy of it."""
+        # Fallback data is never stored, so failed fetches are retried
+        with self._fetched_lock:
+            self._fetched[(owner.lower(), repo.lower())] = repo_data
+        return dict(repo_data)
+    
+    def _get_with_rate_limit(self, url: str, headers: Optional[Dict[str, str]]) -> requests.Response:
+        """
+        GET a GitHub API URL, respecting the rate limit.
+        
+        A response that uses up the rate limit is returned right away and
+        only the next request waits for the reset. A request that was
+        rejected because of the limit is retried once after the reset.
+        """
+        self._wait_for_rate_limit()
+        response = self._session.get(url, headers=headers, timeout=_GITHUB_TIMEOUT)
+        
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            self._rate_limit_reset = float(response.headers.get('X-RateLimit-Reset', 0))
+                
+            # Retry requests that were rejected because of the limit
+            if response.status_code in (403, 429) and self._wait_for_rate_limit():
+                response = self._session.get(url, headers=headers, timeout=_GITHUB_TIMEOUT)
+        
+        return response
+    
+    def _wait_for_rate_limit(self) -> bool:
+        """
+        Wait for an exhausted rate limit to reset.
+        
+        Returns:
+            False if the reset is too far away to wait for, True otherwise
+        """
+        wait = self._rate_limit_reset - time.time()
+        if wait <= 0:
+            return True
+        if wait > _RATE_LIMIT_MAX_WAIT:
+            return False
+        
+        logger.warning(f"GitHub API rate limit exhausted, waiting {wait:.0f}s for it to reset")
+        time.sleep(wait)
+        return True
+    
+    def _build_codemeta(self, repo_data: Dict, repo_url: str) -> Dict:
+        """Build the CodeMeta structure with comprehensive metadata for CodeMeta 3.0 compliance."""
+        name = repo_data.get('name', 'Unknown')
+        language = repo_data.get('language')
+        created_at = repo_data.get('created_at')
+        updated_at = repo_data.get('updated_at')
+        readme_url = f"{repo_url}/blob/main/README.md"
+        
         return {
             "@context": self.context_url,
             "@type": "SoftwareSourceCode",
-            "name": repo_data.get('name', 'Unknown'),
+            "name": name,
             "description": repo_data.get('description', 'No description available'),
             "url": repo_url,
             "codeRepository": repo_url,
-            "dateCreated": repo_data.get('created_at', '').split('T')[0] if repo_data.get('created_at') else None,
-            "dateModified": repo_data.get('updated_at', '').split('T')[0] if repo_data.get('updated_at') else None,
+            # GitHub timestamps are ISO 8601, so the date is the first 10 characters
+            "dateCreated": created_at[:10] if created_at else None,
+            "dateModified": updated_at[:10] if updated_at else None,
             "license": self._format_license(repo_data.get('license')),
-            "programmingLanguage": [repo_data.get('language')] if repo_data.get('language') else []
-        }
+            "programmingLanguage": [language] if language else [],
     
-    def _add_comprehensive_metadata(self, codemeta: Dict, repo_data: Dict) -> None:
-        """Add comprehensive metadata fields for CodeMeta 3.0 compliance."""
-        repo_url = codemeta['codeRepository']
-        
-        # Development and maintenance information
-        codemeta.update({
+            # Development and maintenance information
             "developmentStatus": "active",
             "applicationCategory": "Research Software",
             "applicationSubCategory": "Scientific Computing",
             "operatingSystem": "Cross-platform",
-            "runtimePlatform": self._determine_runtime_platform(repo_data.get('language')),
+            "runtimePlatform": self._determine_runtime_platform(language),
             
             # Documentation and support
             "softwareHelp": {
                 "@type": "WebSite",
-                "url": f"{repo_url}/blob/main/README.md"
+                "url": readme_url
             },
-            "readme": f"{repo_url}/blob/main/README.md",
+            "readme": readme_url,
             "issueTracker": f"{repo_url}/issues",
             "downloadUrl": f"{repo_url}/archive/refs/heads/main.zip",
             "buildInstructions": {
                 "@type": "WebSite",
-                "url": f"{repo_url}/blob/main/README.md"
+                "url": readme_url
             },
             
             # Development infrastructure
@@ -154,26 +412,15 @@ class CodeMetaGenerator:
             "isPartOf": None,
             
             # Additional metadata
-            "targetProduct": f"{codemeta['name']} software package"
-        })
+            "targetProduct": f"{name} software package"
+        }
     
     def _determine_runtime_platform(self, language: str) -> List[str]:
         """Determine runtime platform based on programming language."""
         if not language:
-            return ["Cross-platform"]
-            
-        language_platforms = {
-            'Python': ["Python 3.8+"],
-            'R': ["R 4.0+"],
-            'JavaScript': ["Node.js", "Web Browser"],
-            'Java': ["Java 8+"],
-            'C++': ["Cross-platform"],
-            'C': ["Cross-platform"],
-            'Go': ["Cross-platform"],
-            'Rust': ["Cross-platform"]
-        }
+            return list(DEFAULT_PLATFORM)
         
-        return language_platforms.get(language, ["Cross-platform"])
+        return list(runtime_platforms(language) or DEFAULT_PLATFORM)
     
     def _format_license(self, license_data: Optional[Dict]) -> Optional[Dict]:
         """Format license information for CodeMeta."""
@@ -247,19 +494,13 @@ class CodeMetaGenerator:
         Returns:
             List of validation warnings/errors
         """
-        warnings = []
-        
         # Required fields
-        required_fields = ["@context", "@type", "name", "description", "url"]
-        for field in required_fields:
-            if field not in codemeta:
-                warnings.append(f"Missing required field: {field}")
+        warnings = [f"Missing required field: {field}"
+                    for field in _REQUIRED_FIELDS if field not in codemeta]
         
         # Recommended fields
-        recommended_fields = ["author", "license", "programmingLanguage", "dateCreated"]
-        for field in recommended_fields:
-            if field not in codemeta or not codemeta[field]:
-                warnings.append(f"Missing recommended field: {field}")
+        warnings.extend(f"Missing recommended field: {field}"
+                        for field in _RECOMMENDED_FIELDS if not codemeta.get(field))
         
         # Schema version check
         if "@context" in codemeta:
@@ -276,8 +517,7 @@ class CodeMetaGenerator:
             codemeta: CodeMeta dictionary
             filepath: Output file path
         """
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(codemeta, f, indent=2, ensure_ascii=False)
+        json_io.dump_json(codemeta, filepath)
 
 
 # Example usage and helper functions
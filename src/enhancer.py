@@ -9,11 +9,84 @@ Author: Ronald Siebes (UCDS Group, VU Amsterdam)
 ORCID: 0000-0001-8772-7904
 """
 
-import json
+import hashlib
 import os
-from typing import Dict, List, Optional, Any
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
 
+try:
+    from . import json_io
+    from .platforms import DEFAULT_PLATFORM, runtime_platforms
+except ImportError:
+    # Run as a script, or imported with src on sys.path
+    import json_io
+    from platforms import DEFAULT_PLATFORM, runtime_platforms
+
+
+def _keyword_pattern(*keywords: str) -> re.Pattern:
+    """Compile a pattern matching any of the keywords anywhere in a text."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Application categories in order of precedence, with the keywords that
+# select them; keywords also match inside longer words
+_CATEGORY_PATTERNS = (
+    (_keyword_pattern("data", "analysis", "statistics", "research", "science"), {
+        "applicationCategory": "Data Science",
+        "applicationSubCategory": "Research Tools"
+    }),
+    (_keyword_pattern("web", "visualization", "dashboard", "interface"), {
+        "applicationCategory": "Web Application",
+        "applicationSubCategory": "Data Visualization"
+    }),
+    (_keyword_pattern("workshop", "tutorial", "education", "teaching"), {
+        "applicationCategory": "Education",
+        "applicationSubCategory": "Training Materials"
+    }),
+    (_keyword_pattern("synthetic", "generation", "simulation"), {
+        "applicationCategory": "Data Science",
+        "applicationSubCategory": "Data Generation"
+    })
+)
+# Any category keyword; text without one skips the per-category scans
+_ANY_CATEGORY_PATTERN = re.compile("|".join(pattern.pattern for pattern, _ in _CATEGORY_PATTERNS))
+_DEFAULT_CATEGORY = {
+    "applicationCategory": "Research Software",
+    "applicationSubCategory": "Scientific Computing"
+}
+
+# Fields added by enhance_codemeta when they are missing
+_ADDED_FIELD_SET = frozenset((
+    "maintainer", "developmentStatus", "softwareVersion",
+    "applicationCategory", "operatingSystem", "runtimePlatform",
+    "softwareHelp", "readme", "issueTracker", "downloadUrl",
+    "buildInstructions", "contIntegration", "embargoDate", "funding",
+    "hasSourceCode", "targetProduct", "referencePublication", "relatedLink"
+))
+
+# Fields an enhanced CodeMeta file is expected to have
+_COMPREHENSIVE_FIELDS = (
+    "maintainer", "developmentStatus", "applicationCategory",
+    "operatingSystem", "runtimePlatform", "softwareHelp",
+    "readme", "issueTracker", "downloadUrl"
+)
+_COMPREHENSIVE_FIELD_SET = frozenset(_COMPREHENSIVE_FIELDS)
+
+# GitHub repositories of common packages by lowercased package name
+# (simplified mapping - in practice, you'd want a more comprehensive database)
+_GITHUB_PACKAGE_MAP = {
+    "numpy": "https://github.com/numpy/numpy",
+    "pandas": "https://github.com/pandas-dev/pandas",
+    "requests": "https://github.com/psf/requests",
+    "flask": "https://github.com/pallets/flask",
+    "django": "https://github.com/django/django",
+    "tensorflow": "https://github.com/tensorflow/tensorflow",
+    "pytorch": "https://github.com/pytorch/pytorch",
+    "scikit-learn": "https://github.com/scikit-learn/scikit-learn"
+}
+
 
 class CodeMetaEnhancer:
     """
@@ -36,52 +109,68 @@ class CodeMetaEnhancer:
         self.target_schema = target_schema
         self.target_context = f"https://doi.org/10.5063/schema/codemeta-{target_schema}"
     
-    def enhance_file(self, filepath: str, output_path: Optional[str] = None) -> Dict:
+    def enhance_file(self, filepath: str, output_path: Optional[str] = None,
+                     pretty: bool = True) -> Dict:
         """
         Enhance a CodeMeta file with comprehensive metadata.
         
         Args:
             filepath: Path to input CodeMeta file
             output_path: Path for output file (overwrites input if None)
+            pretty: Write indented JSON; disable to write compact JSON for
+                files that are only processed further by tools
             
         Returns:
             Enhanced CodeMeta dictionary
         """
         # Load existing CodeMeta file
-        with open(filepath, 'r', encoding='utf-8') as f:
-            codemeta = json.load(f)
+        codemeta = json_io.load_json(filepath)
+        original_items = list(codemeta.items())
         
-        # Enhance the CodeMeta data
-        enhanced = self.enhance_codemeta(codemeta)
+        # Enhance the CodeMeta data; the loaded dictionary is not used otherwise
+        enhanced = self.enhance_codemeta(codemeta, in_place=True)
         
-        # Save enhanced file
+        # Save enhanced file, unless an already enhanced file would be
+        # overwritten with the same content, so that its modification time
+        # is kept for tools that look at it
         output_file = output_path or filepath
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(enhanced, f, indent=2, ensure_ascii=False)
+        data = json_io.dumps(enhanced, pretty)
+        if output_file == filepath and list(enhanced.items()) == original_items:
+            with open(filepath, 'rb') as f:
+                if f.read() == data:
+                    return enhanced
+        
+        with open(output_file, 'wb') as f:
+            f.write(data)
         
         return enhanced
     
-    def enhance_codemeta(self, codemeta: Dict) -> Dict:
+    def enhance_codemeta(self, codemeta: Dict, in_place: bool = False) -> Dict:
         """
         Enhance a CodeMeta dictionary with comprehensive metadata.
         
+        Only top-level fields are added or replaced, so nested values are
+        shared between the input and the enhanced dictionary either way.
+        
         Args:
             codemeta: Input CodeMeta dictionary
+            in_place: Enhance the input dictionary itself instead of a copy,
+                for callers that do not need the original anymore
             
         Returns:
             Enhanced CodeMeta dictionary
         """
         # Create a copy to avoid modifying the original
-        enhanced = codemeta.copy()
+        enhanced = codemeta if in_place else codemeta.copy()
         
         # Upgrade schema version
         self._upgrade_schema(enhanced)
         
-        # Add missing core fields
-        self._add_missing_core_fields(enhanced)
-        
-        # Add comprehensive metadata
-        self._add_comprehensive_metadata(enhanced)
+        # Add missing core fields and comprehensive metadata; files that
+        # already have every field added here are left as they are
+        if not _ADDED_FIELD_SET <= enhanced.keys():
+            self._add_missing_core_fields(enhanced)
+            self._add_comprehensive_metadata(enhanced)
         
         # Ensure proper field ordering
         self._reorder_fields(enhanced)
@@ -131,16 +220,11 @@ class CodeMetaEnhancer:
             self._add_repository_urls(codemeta, repo_url)
         
         # Research context fields
-        research_fields = {
-            "embargoDate": None,
-            "funding": None,
-            "hasSourceCode": repo_url,
-            "targetProduct": f"{codemeta.get('name', 'Software')} software package"
-        }
-        
-        for field, default_value in research_fields.items():
-            if field not in codemeta:
-                codemeta[field] = default_value
+        codemeta.setdefault("embargoDate", None)
+        codemeta.setdefault("funding", None)
+        codemeta.setdefault("hasSourceCode", repo_url)
+        if "targetProduct" not in codemeta:
+            codemeta["targetProduct"] = f"{codemeta.get('name', 'Software')} software package"
         
         # Initialize reference publication if not present
         if "referencePublication" not in codemeta:
@@ -153,38 +237,21 @@ class CodeMetaEnhancer:
     def _determine_application_category(self, codemeta: Dict) -> Dict:
         """Determine application category based on project characteristics."""
         keywords = codemeta.get("keywords", [])
-        name = codemeta.get("name", "").lower()
-        description = codemeta.get("description", "").lower()
+        # Keywords may also be given as a single text, e.g. "dashboard, web"
+        if isinstance(keywords, str):
+            keywords = [keywords]
         
-        # Combine text for analysis
-        text_content = " ".join([name, description] + keywords).lower()
+        # Combine text for analysis, lowercasing it in a single pass
+        text_content = " ".join([codemeta.get("name", ""), codemeta.get("description", ""),
+                                 *(str(keyword) for keyword in keywords)]).lower()
         
         # Category determination logic
-        if any(word in text_content for word in ["data", "analysis", "statistics", "research", "science"]):
-            return {
-                "applicationCategory": "Data Science",
-                "applicationSubCategory": "Research Tools"
-            }
-        elif any(word in text_content for word in ["web", "visualization", "dashboard", "interface"]):
-            return {
-                "applicationCategory": "Web Application",
-                "applicationSubCategory": "Data Visualization"
-            }
-        elif any(word in text_content for word in ["workshop", "tutorial", "education", "teaching"]):
-            return {
-                "applicationCategory": "Education",
-                "applicationSubCategory": "Training Materials"
-            }
-        elif any(word in text_content for word in ["synthetic", "generation", "simulation"]):
-            return {
-                "applicationCategory": "Data Science",
-                "applicationSubCategory": "Data Generation"
-            }
-        else:
-            return {
-                "applicationCategory": "Research Software",
-                "applicationSubCategory": "Scientific Computing"
-            }
+        if _ANY_CATEGORY_PATTERN.search(text_content):
+            for pattern, category in _CATEGORY_PATTERNS:
+                if pattern.search(text_content):
+                    return dict(category)
+        
+        return dict(_DEFAULT_CATEGORY)
     
     def _determine_runtime_platform(self, codemeta: Dict) -> List[str]:
         """Determine runtime platform based on programming language."""
@@ -194,39 +261,30 @@ class CodeMetaEnhancer:
         
         platforms = []
         for lang in prog_lang:
-            if lang == "Python":
-                platforms.append("Python 3.8+")
-            elif lang == "R":
-                platforms.append("R 4.0+")
-            elif lang == "JavaScript":
-                platforms.extend(["Node.js", "Web Browser"])
-            elif lang in ["Java"]:
-                platforms.append("Java 8+")
-            elif lang in ["C++", "C", "Go", "Rust"]:
-                platforms.append("Cross-platform")
-        
-        return platforms if platforms else ["Cross-platform"]
+            # Languages may also be given as objects, which are not looked up
+            if isinstance(lang, str):
+                platforms.extend(runtime_platforms(lang))
+        
+        return platforms if platforms else list(DEFAULT_PLATFORM)
     
     def _add_repository_urls(self, codemeta: Dict, repo_url: str) -> None:
         """Add repository-based URLs for documentation and support."""
-        url_fields = {
-            "softwareHelp": {
-                "@type": "WebSite",
-                "url": f"{repo_url}/blob/main/README.md"
-            },
-            "readme": f"{repo_url}/blob/main/README.md",
-            "issueTracker": f"{repo_url}/issues",
-            "downloadUrl": f"{repo_url}/archive/refs/heads/main.zip",
-            "buildInstructions": {
-                "@type": "WebSite",
-                "url": f"{repo_url}/blob/main/README.md"
-            },
-            "contIntegration": f"{repo_url}/actions"
-        }
-        
-        for field, value in url_fields.items():
-            if field not in codemeta:
-                codemeta[field] = value
+        # Values are only built for missing fields, as already enhanced
+        # files usually have all of them
+        readme_url = f"{repo_url}/blob/main/README.md"
+        
+        if "softwareHelp" not in codemeta:
+            codemeta["softwareHelp"] = {"@type": "WebSite", "url": readme_url}
+        if "readme" not in codemeta:
+            codemeta["readme"] = readme_url
+        if "issueTracker" not in codemeta:
+            codemeta["issueTracker"] = f"{repo_url}/issues"
+        if "downloadUrl" not in codemeta:
+            codemeta["downloadUrl"] = f"{repo_url}/archive/refs/heads/main.zip"
+        if "buildInstructions" not in codemeta:
+            codemeta["buildInstructions"] = {"@type": "WebSite", "url": readme_url}
+        if "contIntegration" not in codemeta:
+            codemeta["contIntegration"] = f"{repo_url}/actions"
     
     def _reorder_fields(self, codemeta: Dict) -> None:
         """Ensure proper field ordering with isPartOf near the end."""
@@ -284,34 +342,27 @@ class CodeMetaEnhancer:
             # Extract package name from GitHub URL
             parts = requirement.split("/")
             package_name = parts[-1] if len(parts) > 0 else "unknown"
+            identifier = package_name.lower()
             github_url = requirement
         else:
             # Assume it's a package name
             package_name = requirement
-            github_url = self._get_github_url_for_package(package_name) if github_mapping else requirement
+            identifier = package_name.lower()
+            github_url = self._get_github_url_for_package(package_name, identifier) if github_mapping else requirement
         
         return {
             "@id": github_url,
             "@type": "SoftwareApplication",
-            "identifier": package_name.lower(),
+            "identifier": identifier,
             "name": package_name
         }
     
-    def _get_github_url_for_package(self, package_name: str) -> str:
+    def _get_github_url_for_package(self, package_name: str, identifier: Optional[str] = None) -> str:
         """Get GitHub URL for a package name (simplified mapping)."""
-        # This is a simplified mapping - in practice, you'd want a more comprehensive database
-        common_packages = {
-            "numpy": "https://github.com/numpy/numpy",
-            "pandas": "https://github.com/pandas-dev/pandas",
-            "requests": "https://github.com/psf/requests",
-            "flask": "https://github.com/pallets/flask",
-            "django": "https://github.com/django/django",
-            "tensorflow": "https://github.com/tensorflow/tensorflow",
-            "pytorch": "https://github.com/pytorch/pytorch",
-            "scikit-learn": "https://github.com/scikit-learn/scikit-learn"
-        }
+        if identifier is None:
+            identifier = package_name.lower()
         
-        return common_packages.get(package_name.lower(), f"https://github.com/search?q={package_name}")
+        return _GITHUB_PACKAGE_MAP.get(identifier, f"https://github.com/search?q={package_name}")
     
     def validate_enhancement(self, codemeta: Dict) -> List[str]:
         """
@@ -330,15 +381,9 @@ class CodeMetaEnhancer:
         if self.target_schema not in context:
             messages.append(f"Warning: Schema version may not match target {self.target_schema}")
         
-        # Check for comprehensive fields
-        comprehensive_fields = [
-            "maintainer", "developmentStatus", "applicationCategory",
-            "operatingSystem", "runtimePlatform", "softwareHelp",
-            "readme", "issueTracker", "downloadUrl"
-        ]
-        
-        missing_fields = [field for field in comprehensive_fields if field not in codemeta]
-        if missing_fields:
+        # Check for comprehensive fields, listing missing ones in their usual order
+        if not _COMPREHENSIVE_FIELD_SET <= codemeta.keys():
+            missing_fields = [field for field in _COMPREHENSIVE_FIELDS if field not in codemeta]
             messages.append(f"Missing comprehensive fields: {', '.join(missing_fields)}")
         
         # Check software requirements format
@@ -354,36 +399,130 @@ class CodeMetaEnhancer:
         return messages
 
 
-def enhance_directory(directory_path: str, output_dir: Optional[str] = None) -> None:
+# Sidecar file in which enhance_directory remembers the files it enhanced
+_ENHANCER_CACHE_FILE = ".enhancer_cache.json"
+
+# Fewest files for which enhance_directory starts worker processes; for
+# fewer files, starting the processes costs more than it saves
+_PROCESS_POOL_MIN_FILES = 8
+
+
+def _cache_entry(input_path: str, output_path: str, pretty: bool) -> Optional[List]:
+    """Return the (mtime_ns, size, output SHA-1, pretty) cache entry of an enhanced file."""
+    try:
+        stat = os.stat(input_path)
+        with open(output_path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+    
+    return [stat.st_mtime_ns, stat.st_size, digest, pretty]
+
+
+def _enhance_one(task: Tuple[str, str, bool]) -> Tuple[bool, List[str]]:
+    """
+    Enhance a single file in a worker process.
+    
+    Args:
+        task: (input path, output path, pretty) tuple
+        
+    Returns:
+        (success, validation messages or error message) tuple
+    """
+    input_path, output_path, pretty = task
+    enhancer = CodeMetaEnhancer()
+    
+    try:
+        enhanced = enhancer.enhance_file(input_path, output_path, pretty)
+        return True, enhancer.validate_enhancement(enhanced)
+    except Exception as e:
+        return False, [str(e)]
+
+
+def _enhance_all(tasks: List[Tuple[str, str, bool]], max_workers: Optional[int],
+                 use_processes: bool) -> Iterator[Tuple[bool, List[str]]]:
+    """Yield the _enhance_one results of the tasks, in task order."""
+    # Never start more workers than there are files
+    max_workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    
+    if use_processes and max_workers > 1 and len(tasks) >= _PROCESS_POOL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(_enhance_one, tasks, chunksize=8)
+    else:
+        yield from map(_enhance_one, tasks)
+
+
+def enhance_directory(directory_path: str, output_dir: Optional[str] = None,
+                      max_workers: Optional[int] = None, use_cache: bool = False,
+                      pretty: bool = True, use_processes: bool = False) -> None:
     """
     Enhance all CodeMeta files in a directory.
     
+    Files are enhanced one after the other in this process. With
+    use_processes, larger directories are enhanced in parallel worker
+    processes instead; scripts using this on platforms that spawn processes
+    (Windows, macOS) must then call it under an if __name__ == "__main__"
+    guard. Results are printed in directory order.
+    
+    With use_cache, the modification time and size of each enhanced input, a
+    checksum of its output and the output format are kept in
+    .enhancer_cache.json in the output directory. Files whose input and output
+    are unchanged since the last run are skipped, unless they were written in
+    the other format.
+    
     Args:
         directory_path: Path to directory containing CodeMeta files
         output_dir: Output directory (uses input directory if None)
+        max_workers: Number of worker processes with use_processes (defaults
+            to the CPU count)
+        use_cache: Skip files that are unchanged since they were last enhanced
+        pretty: Write indented JSON; disable to write compact JSON
+        use_processes: Enhance files in worker processes
     """
-    enhancer = CodeMetaEnhancer()
-    
-    # Find all JSON files that look like CodeMeta files
-    codemeta_files = []
-    for filename in os.listdir(directory_path):
-        if filename.endswith('.json') and ('codemeta' in filename.lower() or filename == 'codemeta.json'):
-            codemeta_files.append(filename)
+    # Find all JSON files that look like CodeMeta files; scandir provides
+    # the file type without a separate stat call on most platforms
+    with os.scandir(directory_path) as entries:
+        codemeta_files = [entry.name for entry in entries
+                          if entry.name.endswith('.json') and 'codemeta' in entry.name.lower()
+                          and entry.is_file()]
     
     print(f"Found {len(codemeta_files)} CodeMeta files to enhance...")
     
+    cache_path = os.path.join(output_dir or directory_path, _ENHANCER_CACHE_FILE)
+    cache = {}
+    if use_cache and os.path.exists(cache_path):
+        cache = json_io.load_json(cache_path)
+    
+    filenames = []
+    tasks = []
     for filename in codemeta_files:
         input_path = os.path.join(directory_path, filename)
         output_path = os.path.join(output_dir, filename) if output_dir else input_path
         
-        try:
-            enhanced = enhancer.enhance_file(input_path, output_path)
-            validation_messages = enhancer.validate_enhancement(enhanced)
+        if filename in cache and cache[filename] == _cache_entry(input_path, output_path, pretty):
+            print(f"✅ Unchanged: {filename}")
+            continue
+        
+        filenames.append(filename)
+        tasks.append((input_path, output_path, pretty))
+    
+    if not tasks:
+        return
+        
+    results = _enhance_all(tasks, max_workers, use_processes)
+    for filename, task, (success, messages) in zip(filenames, tasks, results):
+        if success:
             print(f"✅ Enhanced: {filename}")
-            for message in validation_messages:
+            for message in messages:
                 print(f"   {message}")
-        except Exception as e:
-            print(f"❌ Error enhancing {filename}: {e}")
+            if use_cache:
+                cache[filename] = _cache_entry(*task)
+        else:
+            print(f"❌ Error enhancing {filename}: {messages[0]}")
+            cache.pop(filename, None)
+    
+    if use_cache:
+        json_io.dump_json(cache, cache_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+GitHub Cache - Persistent cache for GitHub API responses
+
+This module stores GitHub API responses together with their ETags in a
+SQLite database, so repeated runs can use conditional requests and reuse
+the cached response when GitHub answers 304 Not Modified.
+
+Author: Ronald Siebes (UCDS Group, VU Amsterdam)
+ORCID: 0000-0001-8772-7904
+"""
+
+import sqlite3
+import threading
+from typing import Optional, Tuple
+
+
+class GitHubCache:
+    """
+    SQLite-backed cache of GitHub API response bodies and ETags.
+    
+    The cache can be shared between the threads of a bulk run.
+    """
+    
+    def __init__(self, filepath: str):
+        """
+        Open (and create if needed) the cache database.
+        
+        Args:
+            filepath: Path to the SQLite cache file
+        """
+        self.filepath = filepath
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(filepath, check_same_thread=False)
+        
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL)"
+            )
+    
+    def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key, e.g. "owner/repo"
+            
+        Returns:
+            (ETag, response body) tuple, or None if the key is not cached
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT etag, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        
+        return (row[0], bytes(row[1])) if row else None
+    
+    def set(self, key: str, etag: str, body: bytes) -> None:
+        """
+        Store a response.
+        
+        Args:
+            key: Cache key, e.g. "owner/repo"
+            etag: ETag header of the response
+            body: Raw response body
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, body) VALUES (?, ?, ?)",
+                (key, etag, body)
+            )
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._connection.close()
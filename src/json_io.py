@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+JSON I/O - Fast JSON reading and writing for CodeMeta files
+
+This module wraps the JSON backend used for loading and saving CodeMeta
+files. It prefers orjson, falls back to ujson, and finally to the standard
+library, while producing the same UTF-8, two-space indented output. Compact
+output without indentation is available for files that are not meant to be
+read by people.
+
+Author: Ronald Siebes (UCDS Group, VU Amsterdam)
+ORCID: 0000-0001-8772-7904
+"""
+
+import json
+import mmap
+import os
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Files of at least this many bytes are memory-mapped when parsed with
+# orjson; for smaller files the mapping costs more than reading them
+_MMAP_MIN_SIZE = 1 << 20
+
+
+def loads(data: bytes) -> Any:
+    """
+    Parse JSON from raw bytes.
+    
+    Args:
+        data: UTF-8 encoded JSON document
+        
+    Returns:
+        Parsed JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = True) -> bytes:
+    """
+    Serialize a value to UTF-8 encoded JSON.
+    
+    Args:
+        obj: Value to serialize
+        pretty: Indent with two spaces; otherwise write compact JSON
+        
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if ujson is not None:
+        return ujson.dumps(obj, indent=2 if pretty else 0, ensure_ascii=False,
+                           escape_forward_slashes=False).encode('utf-8')
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def load_json(filepath: str) -> Any:
+    """
+    Load a JSON file.
+    
+    Large files are memory-mapped and parsed in place when orjson is
+    available, instead of being copied into a bytes object first.
+    
+    Args:
+        filepath: Path to the JSON file
+        
+    Returns:
+        Parsed JSON value
+    """
+    with open(filepath, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as data:
+                    return orjson.loads(data)
+        return loads(f.read())
+
+
+def dump_json(obj: Any, filepath: str, pretty: bool = True) -> None:
+    """
+    Save a value to a JSON file.
+    
+    Args:
+        obj: Value to serialize
+        filepath: Output file path
+        pretty: Indent with two spaces; otherwise write compact JSON
+    """
+    with open(filepath, 'wb') as f:
+        f.write(dumps(obj, pretty))
+
+
+def load_json_outline(filepath: str, min_size: int = 1 << 20) -> Any:
+    """
+    Load the top-level outline of a large JSON object file.
+
+    The file is parsed as a stream with ijson, so nested data never has to
+    be built in memory. Top-level scalars are kept as they are. Top-level
+    objects keep their keys with None values, and top-level arrays keep their
+    scalar items plus an empty placeholder for their first nested object or
+    array. Everything deeper is skipped. This keeps key presence, truthiness
+    and the type of the first array item, which is all validation looks at.
+
+    Files smaller than min_size, documents that are not JSON objects and
+    environments without ijson are loaded completely, which is faster for
+    small files.
+
+    Args:
+        filepath: Path to the JSON file
+        min_size: Minimum file size in bytes for streaming the outline
+
+    Returns:
+        Outline of the JSON object, or the complete parsed JSON value
+    """
+    if ijson is None or os.path.getsize(filepath) < min_size:
+        return load_json(filepath)
+
+    with open(filepath, 'rb') as f:
+        events = ijson.parse(f, use_float=True)
+        prefix, event, value = next(events)
+        if event != 'start_map':
+            return load_json(filepath)
+
+        outline: Dict[str, Any] = {}
+        container = None
+        has_placeholder = False
+        key = None
+        depth = 1
+
+        for prefix, event, value in events:
+            if depth == 1:
+                if event == 'map_key':
+                    key = value
+                elif event == 'start_map':
+                    container = outline[key] = {}
+                    depth += 1
+                elif event == 'start_array':
+                    container = outline[key] = []
+                    has_placeholder = False
+                    depth += 1
+                elif event != 'end_map':
+                    outline[key] = value
+            elif depth == 2:
+                if event in ('start_map', 'start_array'):
+                    if isinstance(container, list) and not has_placeholder:
+                        container.append({} if event == 'start_map' else [])
+                        has_placeholder = True
+                    depth += 1
+                elif event in ('end_map', 'end_array'):
+                    depth -= 1
+                elif event == 'map_key':
+                    container[value] = None
+                elif isinstance(container, list):
+                    container.append(value)
+            elif event in ('start_map', 'start_array'):
+                depth += 1
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+
+        return outline
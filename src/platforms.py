@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Platforms - Runtime platforms of programming languages
+
+This module maps programming language names to the runtime platforms that
+the generator and the enhancer write to CodeMeta files, so that both
+derive the same runtimePlatform from the same language.
+
+Author: Ronald Siebes (UCDS Group, VU Amsterdam)
+ORCID: 0000-0001-8772-7904
+"""
+
+from typing import Tuple
+
+# Runtime platforms by casefolded programming language
+_LANG_PLATFORMS = {
+    'python': ("Python 3.8+",),
+    'r': ("R 4.0+",),
+    'javascript': ("Node.js", "Web Browser"),
+    'java': ("Java 8+",),
+    'c++': ("Cross-platform",),
+    'c': ("Cross-platform",),
+    'go': ("Cross-platform",),
+    'rust': ("Cross-platform",)
+}
+
+# Runtime platform written when no language has a known platform
+DEFAULT_PLATFORM = ("Cross-platform",)
+
+
+def runtime_platforms(language: str) -> Tuple[str, ...]:
+    """
+    Look up the runtime platforms of a programming language.
+    
+    Language names are matched regardless of case, as GitHub and hand-written
+    CodeMeta files do not agree on it.
+    
+    Args:
+        language: Programming language name, e.g. "Python"
+        
+    Returns:
+        Runtime platforms, or an empty tuple for unknown languages
+    """
+    return _LANG_PLATFORMS.get(language.casefold(), ())